@@ -1,141 +1,418 @@
 import argparse
-import subprocess
+import asyncio
+import aiohttp
+import csv
+import functools
+import hashlib
+import json
 import pathlib
 import time
 import re
 import os
 import shutil  # For tool checks
+import signal
+import subprocess
+import urllib.parse
+
+try:
+    import orjson  # Optional: faster JSON report serialization
+except ImportError:
+    orjson = None
+
+# Basic endpoint regex for JS discovery (compiled once, reused per JS file)
+_ENDPOINT_RE = re.compile(r'[/\w-]+\?\w+=', re.ASCII)
+
+# Tool outputs keyed by command line, reused by --resume
+_CACHE_ROOT = pathlib.Path.home() / '.autoscope' / 'cache'
+
+# Start each tool in its own process group so a timeout also reaps anything it spawned
+if os.name == 'nt':
+    _GROUP_KWARGS = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _GROUP_KWARGS = {'start_new_session': True}
+
+@functools.lru_cache(maxsize=None)
+def _which(tool):
+    """Cached PATH lookup; tool locations don't change during a scan."""
+    return shutil.which(tool)
+
+def _dump_json(obj):
+    """Serialize obj to indented JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+def _prune_cache(ttl):
+    """Remove cache entries older than ttl seconds, plus any left incomplete."""
+    try:
+        entries = list(os.scandir(_CACHE_ROOT))
+    except FileNotFoundError:
+        return
+    now = time.time()
+    for entry in entries:
+        try:
+            expired = now - os.stat(os.path.join(entry.path, '.complete')).st_mtime > ttl
+        except FileNotFoundError:
+            expired = now - entry.stat().st_mtime > ttl  # Interrupted store; give in-flight runs time to finish
+        if expired:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+def _js_urls(f):
+    """Yield the .js URLs listed in an open httpx output file."""
+    for line in f:
+        url = line.strip()
+        if url.endswith('.js'):
+            yield url
 
 class BaseModule:
     """Base class for all reconnaissance modules."""
     name = "base"
     output_file = "output.txt"
+    argv_template = ()  # Tool argv with {placeholders}, filled in by format_argv()
 
     def __init__(self, target, output_dir, config=None):
         self.target = target
         self.output_dir = pathlib.Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.config = config or {}  # For future YAML config
+        self.timed_out = False
 
     def check_tool(self, tool):
         """Check if tool is available."""
-        if shutil.which(tool) is None:
+        if _which(tool) is None:
             print(f"[ERROR] {tool} not found. Please install it and add to PATH.")
             return False
         return True
 
-    def run_cmd(self, cmd, outfile_path):
-        """Run external command with error handling."""
+    def format_argv(self, **values):
+        """Fill argv_template; {target} defaults to this module's target."""
+        values.setdefault('target', self.target)
+        return [arg.format_map(values) for arg in self.argv_template]
+
+    async def run_cmd(self, argv, outfile_path):
+        """Run external command with error handling.
+
+        Every tool writes its own output file (-o/-oT/-P), so stdout is discarded
+        rather than buffered in memory and written a second time.
+        """
+        return await self.run_pipeline([argv], outfile_path)
+
+    async def run_pipeline(self, argvs, outfile_path, outputs=None):
+        """Run commands chained stdout -> stdin like a shell pipe, with error handling.
+
+        Each pipe is an OS pipe handed straight to the next tool, so data never
+        passes through Python. The last command's stdout is discarded.
+        The files in outputs (default: outfile_path) are cached after a
+        successful run and restored instead of re-running under --resume.
+        The timeout budget is per tool, so a pipeline gets timeout * len(argvs);
+        self.timed_out records whether it ran out.
+        """
+        outputs = outputs or [outfile_path]
+        self.timed_out = False
+        cache_dir = self._cache_dir(argvs)
+        if self.config.get('resume') and self._restore_cached(cache_dir, outputs):
+            print(f"[SUCCESS] Reused cached {self.name} output: {outfile_path}")
+            return True
+        procs = []
+        stdin = None
         try:
             start = time.time()
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=self.config.get('timeout', 300))
-            if result.returncode != 0:
-                print(f"[ERROR] in {self.name}: {result.stderr.strip()}")
+            for i, argv in enumerate(argvs):
+                if i == len(argvs) - 1:
+                    read_fd, write_fd = None, asyncio.subprocess.DEVNULL
+                else:
+                    read_fd, write_fd = os.pipe()
+                try:
+                    procs.append(await asyncio.create_subprocess_exec(
+                        *argv,
+                        stdin=stdin, stdout=write_fd, stderr=asyncio.subprocess.PIPE, **_GROUP_KWARGS))
+                except BaseException:
+                    if read_fd is not None:
+                        os.close(read_fd)
+                    raise
+                finally:
+                    # Drop the parent's copies so EOF reaches the next tool when this one exits
+                    if stdin is not None:
+                        os.close(stdin)
+                    if read_fd is not None:
+                        os.close(write_fd)
+                stdin = read_fd
+            results = await asyncio.wait_for(asyncio.gather(*(proc.communicate() for proc in procs)),
+                                             timeout=self.config.get('timeout', 300) * len(argvs))
+            failed = False
+            for argv, proc, (_, stderr) in zip(argvs, procs, results):
+                if proc.returncode != 0:
+                    tool = f" ({argv[0]})" if len(argvs) > 1 else ""
+                    print(f"[ERROR] in {self.name}{tool}: {stderr.decode(errors='replace').strip()}")
+                    failed = True
+            if failed:
                 return False
-            with open(outfile_path, 'w') as f:
-                f.write(result.stdout)
+            self._store_cached(cache_dir, outputs)
             print(f"[SUCCESS] Completed {self.name} in {time.time() - start:.2f}s. Output: {outfile_path}")
             return True
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
+            self.timed_out = True
             print(f"[ERROR] Timeout in {self.name}")
             return False
         except Exception as e:
             print(f"[ERROR] Failure in {self.name}: {str(e)}")
             return False
+        finally:
+            # Tools run in their own session and never see the terminal's SIGINT,
+            # so reap them here on timeout, failure, and Ctrl-C (CancelledError) alike
+            for proc in procs:
+                if proc.returncode is None:
+                    await self._kill_group(proc)
 
-    def execute(self):
+    def _cache_dir(self, argvs):
+        """Cache location for a command line; argv already includes target and flags."""
+        return _CACHE_ROOT / hashlib.sha256(json.dumps(argvs).encode()).hexdigest()
+
+    def _restore_cached(self, cache_dir, outputs):
+        """Copy cached outputs into place if a fresh cache entry exists."""
+        try:
+            age = time.time() - (cache_dir / '.complete').stat().st_mtime
+        except FileNotFoundError:
+            return False
+        if age > self.config.get('cache_ttl', 86400):
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            return False
+        for i, path in enumerate(outputs):
+            cached = cache_dir / f"{i}_{os.path.basename(path)}"
+            if cached.exists():
+                shutil.copyfile(cached, path)
+            else:
+                # The cached run wrote nothing here; don't pass off an older scan's file as its result
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+        return True
+
+    def _store_cached(self, cache_dir, outputs):
+        """Replace the cache entry for a command line with this run's outputs."""
+        try:
+            # Start from an empty entry so outputs this run didn't write aren't restored from an older one
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for i, path in enumerate(outputs):
+                if os.path.isfile(path):
+                    shutil.copyfile(path, cache_dir / f"{i}_{os.path.basename(path)}")
+            (cache_dir / '.complete').touch()  # Written last so partial entries are never reused
+        except OSError as e:
+            print(f"[INFO] Could not cache {self.name} output: {str(e)}")
+
+    async def _kill_group(self, proc):
+        """Terminate a still-running tool and its children, escalating to a hard kill."""
+        try:
+            if os.name == 'nt':
+                proc.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                os.killpg(proc.pid, signal.SIGTERM)
+            await asyncio.wait_for(proc.wait(), timeout=5)
+        except ProcessLookupError:
+            pass  # Already exited
+        except asyncio.TimeoutError:
+            try:
+                if os.name == 'nt':
+                    proc.kill()
+                else:
+                    os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+
+    async def execute(self):
         raise NotImplementedError("Subclasses must implement execute()")
 
 class SubdomainModule(BaseModule):
     name = "subdomain"
     output_file = "subs.txt"
+    argv_template = ("subfinder", "-d", "{target}", "-silent", "-o", "{outfile}")
 
-    def execute(self):
+    def build_argv(self):
+        """Return the subfinder argv, or None if subfinder is unavailable."""
         if not self.check_tool("subfinder"):
             print("[ERROR] Install subfinder via: go install github.com/projectdiscovery/subfinder/v2/cmd/subfinder@latest")
-            return False
+            return None
         outfile = str(self.output_dir / self.output_file)
-        cmd = f"subfinder -d {self.target} -silent -o {outfile}"
-        if self.config.get('deep'): cmd += " -all"  # Example deep flag extension
-        return self.run_cmd(cmd, outfile)
+        argv = self.format_argv(outfile=outfile)
+        if self.config.get('deep'): argv.append("-all")  # Example deep flag extension
+        return argv
+
+    async def execute(self):
+        argv = self.build_argv()
+        if argv is None:
+            return False
+        return await self.run_cmd(argv, str(self.output_dir / self.output_file))
 
 class PortsModule(BaseModule):
     name = "ports"
     output_file = "ports.txt"
+    argv_template = ("naabu", "-host", "{target}", "-p", "{port_range}", "-silent", "-o", "{outfile}")
 
-    def execute(self):
+    async def execute(self):
         if not self.check_tool("naabu"):
             print("[ERROR] Install naabu via: go install github.com/projectdiscovery/naabu/v2/cmd/naabu@latest")
             return False
         outfile = str(self.output_dir / self.output_file)
         port_range = "1-1000" if self.config.get('fast') else "1-65535"
-        cmd = f"naabu -host {self.target} -p {port_range} -silent -o {outfile}"
-        return self.run_cmd(cmd, outfile)
+        argv = self.format_argv(port_range=port_range, outfile=outfile)
+        return await self.run_cmd(argv, outfile)
 
 class HttpProbeModule(BaseModule):
     name = "http_probe"
     output_file = "httpx.txt"
+    json_file = "httpx.json"  # Raw httpx JSON lines; httpx.txt and tech.txt are derived from it
+    argv_template = ("httpx", "-silent", "-json", "-o", "{outfile}", "-tech-detect")
+
+    def build_argv(self, piped=False):
+        """Return the httpx argv, or None if it can't run.
 
-    def execute(self):
+        With piped=True httpx reads hosts from stdin instead of subs.txt.
+        """
         if not self.check_tool("httpx"):
             print("[ERROR] Install httpx via: go install github.com/projectdiscovery/httpx/cmd/httpx@latest")
-            return False
+            return None
+        if piped:
+            source = []
+        else:
+            subs_file = str(self.output_dir / 'subs.txt')
+            if not os.path.exists(subs_file):
+                print("[INFO] Skipping HTTP probe: subs.txt not found")
+                return None
+            source = ["-l", subs_file]
+        json_file = str(self.output_dir / self.json_file)
+        argv = self.format_argv(outfile=json_file) + source
+        if self.config.get('screenshots', True):
+            # Screenshot in the same pass rather than re-fetching every live host later;
+            # PNGs go to -srd, so keep them and the headless body out of the JSON lines
+            argv += ["-screenshot", "-srd", str(self.output_dir / ScreenshotModule.output_file), "-esb", "-ehb"]
+        return argv
+
+    def extract(self):
+        """Derive httpx.txt (live URLs) and tech.txt from httpx's JSON output."""
+        # Python equivalent for URL/tech extraction (Windows-friendly)
         outfile = str(self.output_dir / self.output_file)
-        subs_file = str(self.output_dir / 'subs.txt')
-        if not os.path.exists(subs_file):
-            print("[INFO] Skipping HTTP probe: subs.txt not found")
-            return False
-        cmd = f"httpx -l {subs_file} -silent -o {outfile} -tech-detect"
-        if not self.run_cmd(cmd, outfile):
-            return False
-        # Python equivalent for tech extraction (Windows-friendly)
+        json_file = str(self.output_dir / self.json_file)
         tech_file = str(self.output_dir / "tech.txt")
         try:
-            with open(outfile, 'r') as f, open(tech_file, 'w') as tf:
+            with open(json_file, 'r') as f, open(outfile, 'w') as uf, open(tech_file, 'w') as tf:
                 for line in f:
-                    parts = line.split()
-                    if len(parts) > 1:
-                        tf.write(parts[1] + '\n')
-            print(f"[SUCCESS] Tech detection saved to {tech_file}")
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Last line may be cut short if httpx was killed on timeout
+                    uf.write(record['url'] + '\n')
+                    if record.get('tech'):
+                        tf.write(','.join(record['tech']) + '\n')
+            print(f"[SUCCESS] Live hosts saved to {outfile}, tech detection to {tech_file}")
             return True
         except Exception as e:
             print(f"[ERROR] Tech extraction failed: {str(e)}")
             return False
 
+    async def execute(self):
+        argv = self.build_argv()
+        if argv is None:
+            return False
+        if not await self.run_cmd(argv, str(self.output_dir / self.json_file)):
+            return False
+        return self.extract()
+
+class SubdomainProbeModule(BaseModule):
+    """Subdomain enumeration streamed straight into the HTTP probe.
+
+    subfinder still writes subs.txt via -o, while its stdout feeds httpx's
+    stdin so probing starts with the first subdomain instead of after the last.
+    """
+    name = "subdomain+http_probe"
+
+    def __init__(self, target, output_dir, config=None):
+        super().__init__(target, output_dir, config)
+        self.subdomain = SubdomainModule(target, output_dir, config)
+        self.http_probe = HttpProbeModule(target, output_dir, config)
+
+    async def execute(self):
+        sub_argv = self.subdomain.build_argv()
+        probe_argv = self.http_probe.build_argv(piped=True)
+        if sub_argv is None or probe_argv is None:
+            return False
+        subs_file = str(self.output_dir / SubdomainModule.output_file)
+        json_file = str(self.output_dir / HttpProbeModule.json_file)
+        if not await self.run_pipeline([sub_argv, probe_argv], json_file, outputs=[subs_file, json_file]):
+            if not self.timed_out:
+                return False
+            # Keep whatever httpx probed before the timeout so later stages still have hosts,
+            # but still report the module as failed
+            if self.http_probe.extract():
+                print("[INFO] HTTP probe results are partial: the pipeline timed out")
+            return False
+        return self.http_probe.extract()
+
 class JsDiscoveryModule(BaseModule):
     name = "js_discovery"
     output_file = "endpoints.txt"
 
-    def execute(self):
-        if not self.check_tool("curl"):
-            print("[ERROR] curl not found. Install curl for Windows or use native requests.")
-            return False
+    max_concurrency = 32  # Simultaneous JS fetches
+    max_per_host = 6  # Simultaneous JS fetches against one origin
+    max_body_size = 512 * 1024  # Bytes of each JS file scanned for endpoints
+
+    async def _fetch(self, session, url, sem, host_sems, errors):
+        """Fetch one JS file and return the endpoints in it; the body is dropped once scanned."""
+        try:
+            host = urllib.parse.urlsplit(url).netloc  # ValueError on malformed lines, e.g. an unclosed IPv6 bracket
+            host_sem = host_sems.setdefault(host, asyncio.Semaphore(self.max_per_host))
+            async with host_sem, sem:  # Wait on the host first so queued hosts don't hold global slots
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    # Skip oversized bundles up front; otherwise stop reading at the cap
+                    if (response.content_length or 0) > self.max_body_size:
+                        return set()
+                    body = bytearray()
+                    while len(body) < self.max_body_size:
+                        chunk = await response.content.read(self.max_body_size - len(body))
+                        if not chunk:
+                            break
+                        body += chunk
+            return {m.group() for m in _ENDPOINT_RE.finditer(body.decode('utf-8', 'ignore'))}
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+            return set()
+
+    async def execute(self):
         outfile = str(self.output_dir / self.output_file)
         httpx_file = str(self.output_dir / 'httpx.txt')
-        if not os.path.exists(httpx_file):
+        try:
+            httpx_f = open(httpx_file, 'r')
+        except FileNotFoundError:
             print("[INFO] Skipping JS discovery: httpx.txt not found")
             return False
         # Simple regex-based endpoint discovery (fetch and parse JS URLs)
-        with open(httpx_file, 'r') as f:
-            urls = [line.strip() for line in f if line.strip().endswith('.js')]
-        endpoints = []
-        for url in urls:
-            try:
-                response = subprocess.run(f"curl -s {url}", shell=True, capture_output=True, text=True)
-                found = re.findall(r'[/\w-]+\?\w+=', response.stdout)  # Basic endpoint regex
-                endpoints.extend(found)
-            except:
-                pass
+        endpoints = set()
+        errors = {}  # Exception name -> count of failed fetches
+        with httpx_f:
+            sem = asyncio.Semaphore(self.max_concurrency)
+            host_sems = {}
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=self.max_per_host, ttl_dns_cache=300)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                found = await asyncio.gather(*(self._fetch(session, url, sem, host_sems, errors) for url in _js_urls(httpx_f)))
+        if errors:
+            print(f"[INFO] JS fetch errors: {errors}")
+        for matches in found:
+            endpoints.update(matches)
         with open(outfile, 'w') as f:
-            f.write('\n'.join(set(endpoints)))
+            f.write('\n'.join(endpoints))
         print(f"[SUCCESS] Found {len(endpoints)} potential endpoints")
         return bool(endpoints)
 
 class DirBruteforceModule(BaseModule):
     name = "dir_bruteforce"
     output_file = "dirs.txt"
+    argv_template = ("ffuf", "-u", "https://{target}/FUZZ", "-w", "{wordlist}", "-mc", "200,301", "-o", "{outfile}", "-of", "csv")
 
-    def execute(self):
+    async def execute(self):
         if not self.check_tool("ffuf"):
             print("[ERROR] Install ffuf via: go install github.com/ffuf/ffuf/v2@latest")
             return False
@@ -145,58 +422,86 @@ class DirBruteforceModule(BaseModule):
         if not os.path.exists(wordlist):
             print(f"[ERROR] Wordlist not found at {wordlist}. Download one and update the path.")
             return False
-        cmd = f"ffuf -u https://{self.target}/FUZZ -w {wordlist} -mc 200,301 -o {outfile} -of csv"
-        return self.run_cmd(cmd, outfile)
+        argv = self.format_argv(wordlist=wordlist, outfile=outfile)
+        return await self.run_cmd(argv, outfile)
 
 class ParamDiscoveryModule(BaseModule):
     name = "param_discovery"
     output_file = "params.txt"
+    argv_template = ("arjun", "-u", "https://{target}", "--stable", "-oT", "{outfile}")
 
-    def execute(self):
+    async def execute(self):
         if not self.check_tool("arjun"):
             print("[ERROR] Install arjun via: pip install arjun")
             return False
         outfile = str(self.output_dir / self.output_file)
-        cmd = f"arjun -u https://{self.target} --stable -oT {outfile}"
-        return self.run_cmd(cmd, outfile)
+        argv = self.format_argv(outfile=outfile)
+        return await self.run_cmd(argv, outfile)
 
 class ScreenshotModule(BaseModule):
     name = "screenshot"
     output_file = "screenshots/"  # Directory for images
 
-    def execute(self):
-        if not self.check_tool("gowitness"):
-            print("[ERROR] Install gowitness via: go install github.com/sensepost/gowitness@latest")
-            return False
-        out_dir = str(self.output_dir / self.output_file)
-        os.makedirs(out_dir, exist_ok=True)
-        httpx_file = str(self.output_dir / 'httpx.txt')
-        if not os.path.exists(httpx_file):
-            print("[INFO] Skipping screenshots: httpx.txt not found")
+    async def execute(self):
+        # Screenshots are captured by HttpProbeModule's httpx pass; this only reports on them
+        out_dir = self.output_dir / self.output_file
+        shots = sum(1 for _ in out_dir.rglob('*.png')) if out_dir.is_dir() else 0
+        if not shots:
+            print("[INFO] No screenshots captured")
             return False
-        cmd = f"gowitness file -f {httpx_file} -P {out_dir} --headless"
-        return self.run_cmd(cmd, f"{out_dir}/report.html")  # gowitness generates report
+        print(f"[SUCCESS] {shots} screenshots saved to {out_dir}")
+        return True
+
+def _report_artifacts(output_dir):
+    """Return the .txt artifacts in output_dir, sorted by name, from one scandir pass."""
+    # DirEntry.stat() reuses the directory listing where the OS allows
+    with os.scandir(output_dir) as it:
+        return sorted((e for e in it if e.name.endswith('.txt') and e.is_file()), key=lambda e: e.name)
 
 def generate_report(output_dir, format='md'):
-    """Basic report generation with content inclusion."""
+    """Basic report generation.
+
+    Markdown inlines artifact contents; json and csv only list artifact
+    metadata (name, size, path) and never read the artifacts themselves.
+    """
     report_file = output_dir / f"report.{format}"
-    with open(report_file, 'w') as f:
-        f.write("# AutoScope Report\n\n")
-        for file in output_dir.glob('*.txt'):
-            f.write(f"## {file.stem}\n")
-            if os.path.getsize(file) == 0:
-                f.write("Empty - Module Failed or Skipped\n\n")
-            else:
-                with open(file, 'r') as content:
-                    f.write(content.read() + "\n\n")
+    entries = _report_artifacts(output_dir)
+    if format == 'json':
+        rows = [{"name": e.name, "size": e.stat().st_size, "path": e.path} for e in entries]
+        with open(report_file, 'wb') as f:
+            f.write(_dump_json(rows))
+    elif format == 'csv':
+        with open(report_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['name', 'size', 'path'])
+            writer.writerows((e.name, e.stat().st_size, e.path) for e in entries)
+    else:
+        with open(report_file, 'wb') as f:
+            f.write(b"# AutoScope Report\n\n")
+            for entry in entries:
+                f.write(f"## {entry.name[:-len('.txt')]}\n".encode())
+                if entry.stat().st_size == 0:
+                    f.write(b"Empty - Module Failed or Skipped\n\n")
+                else:
+                    # Stream in fixed-size chunks rather than loading the whole artifact
+                    with open(entry.path, 'rb') as content:
+                        shutil.copyfileobj(content, f, length=65536)
+                    f.write(b"\n\n")
     print(f"[INFO] Report generated: {report_file}")
 
+async def run_stages(stages):
+    """Run each stage's modules concurrently, one stage after another."""
+    for stage in stages:
+        for module in stage:
+            print(f"[INFO] Executing module: {module.name}")
+        await asyncio.gather(*(module.execute() for module in stage))
+
 def main():
     parser = argparse.ArgumentParser(description="AutoScope: Modular Recon Framework")
     parser.add_argument('-t', '--target', required=True, help="Target domain/IP or file with targets")
     parser.add_argument('--fast', action='store_true', help="Fast scan profile (limited ports, no deep enum)")
     parser.add_argument('--deep', action='store_true', help="Deep scan profile (full ports, thorough enum)")
-    parser.add_argument('--resume', action='store_true', help="Resume from existing output (TODO: implement)")
+    parser.add_argument('--resume', action='store_true', help="Reuse cached tool output for unchanged commands")
     parser.add_argument('--only-subdomains', action='store_true', help="Run only subdomain enumeration")
     parser.add_argument('--no-dirs', action='store_true', help="Skip directory bruteforce")
     parser.add_argument('--no-screenshots', action='store_true', help="Skip screenshotting")
@@ -208,29 +513,30 @@ def main():
         print("[ERROR] Cannot use --fast and --deep together")
         return
 
-    config = {'fast': args.fast, 'deep': args.deep, 'timeout': 60 if args.fast else 300}
+    config = {'fast': args.fast, 'deep': args.deep, 'screenshots': not args.no_screenshots,
+              'resume': args.resume, 'cache_ttl': 24 * 3600, 'timeout': 60 if args.fast else 300}
     output_dir = pathlib.Path(args.output) / args.target.replace('.', '_')  # Sanitize for folder name
-
-    modules = [
-        SubdomainModule(args.target, output_dir, config),
-        PortsModule(args.target, output_dir, config),
-        HttpProbeModule(args.target, output_dir, config),
-        JsDiscoveryModule(args.target, output_dir, config),
-        DirBruteforceModule(args.target, output_dir, config),
-        ParamDiscoveryModule(args.target, output_dir, config),
-        ScreenshotModule(args.target, output_dir, config)
-    ]
+    _prune_cache(config['cache_ttl'])
 
     if args.only_subdomains:
-        modules = [m for m in modules if isinstance(m, SubdomainModule)]
+        stages = [[SubdomainModule(args.target, output_dir, config)]]
+    else:
+        # Modules within a stage are independent; the second stage reads the first's output
+        stages = [
+            [SubdomainProbeModule(args.target, output_dir, config),
+             PortsModule(args.target, output_dir, config),
+             DirBruteforceModule(args.target, output_dir, config),
+             ParamDiscoveryModule(args.target, output_dir, config)],
+            [JsDiscoveryModule(args.target, output_dir, config),
+             ScreenshotModule(args.target, output_dir, config)]
+        ]
+
     if args.no_dirs:
-        modules = [m for m in modules if not isinstance(m, DirBruteforceModule)]
+        stages = [[m for m in stage if not isinstance(m, DirBruteforceModule)] for stage in stages]
     if args.no_screenshots:
-        modules = [m for m in modules if not isinstance(m, ScreenshotModule)]
+        stages = [[m for m in stage if not isinstance(m, ScreenshotModule)] for stage in stages]
 
-    for module in modules:
-        print(f"[INFO] Executing module: {module.name}")
-        module.execute()
+    asyncio.run(run_stages(stages))
 
     generate_report(output_dir, args.report)
     print("[SUCCESS] AutoScope scan completed!")
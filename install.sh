@@ -111,9 +111,6 @@ go install -v github.com/projectdiscovery/httpx/cmd/httpx@latest
 echo "   🔨 Installing ffuf (web fuzzer)..."
 go install -v github.com/ffuf/ffuf/v2@latest
 
-echo "   📸 Installing gowitness (screenshot tool)..."
-go install -v github.com/sensepost/gowitness@latest
-
 echo "   🗺️  Installing amass (advanced subdomain enum)..."
 go install -v github.com/owasp-amass/amass/v4/...@master
 
@@ -132,7 +129,7 @@ pip3 install --user arjun
 
 # Verify tool installations
 echo "🔍 Verifying tool installations..."
-tools=("subfinder" "naabu" "httpx" "ffuf" "gowitness" "amass" "arjun")
+tools=("subfinder" "naabu" "httpx" "ffuf" "amass" "arjun")
 for tool in "${tools[@]}"; do
     if command -v "$tool" >/dev/null 2>&1; then
         echo "   ✅ $tool: $(command -v $tool)"
@@ -149,7 +146,7 @@ export PATH=$PATH:/usr/local/go/bin:$HOME/go/bin:$HOME/.local/bin
 export GOPATH=$HOME/go
 
 echo "✅ AutoScope environment activated!"
-echo "Available tools: subfinder, naabu, httpx, ffuf, gowitness, amass, arjun"
+echo "Available tools: subfinder, naabu, httpx, ffuf, amass, arjun"
 echo ""
 echo "🚀 Quick start commands:"
 echo "   python3 autoscope.py -t example.com --fast"